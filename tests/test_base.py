@@ -3,12 +3,34 @@
 Base classes for test suites and results
 """
 
+import asyncio
+import functools
+import json
+import time
+from collections import Counter
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Iterable, List, NamedTuple, Optional
+
+from multidict import CIMultiDict, CIMultiDictProxy
+
+try:
+    import orjson
+    
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+    json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib
+    json_dumps = json.dumps
+    json_loads = json.loads
+
+# Case-insensitive empty headers returned when a request never got a response
+NO_HEADERS = CIMultiDictProxy(CIMultiDict())
 
 
 class TestResult:
     """Represents the result of a single test"""
+    __slots__ = ('name', 'status', 'duration', 'message', 'details', 'timestamp')
+    
     def __init__(self, name: str, status: str, duration: float, message: str = "", details: str = ""):
         self.name = name
         self.status = status  # PASS, FAIL, ERROR, SKIP
@@ -18,6 +40,15 @@ class TestResult:
         self.timestamp = datetime.now()
 
 
+class SuiteStats(NamedTuple):
+    """Result counts for a test suite, tallied in one pass"""
+    total: int
+    passed: int
+    failed: int
+    errors: int
+    skipped: int
+
+
 class TestSuite:
     """Represents a collection of test results"""
     def __init__(self, name: str, description: str = ""):
@@ -53,9 +84,40 @@ class TestSuite:
         """Number of skipped tests"""
         return sum(1 for test in self.tests if test.status == 'SKIP')
         
+    def compute_stats(self) -> SuiteStats:
+        """Count every status with a single pass over the tests"""
+        counts = Counter(test.status for test in self.tests)
+        return SuiteStats(len(self.tests), counts['PASS'], counts['FAIL'], counts['ERROR'], counts['SKIP'])
+        
     @property
     def duration(self) -> float:
         """Total duration of the test suite"""
         if self.start_time and self.end_time:
             return (self.end_time - self.start_time).total_seconds()
-        return sum(test.duration for test in self.tests)
\ No newline at end of file
+        return sum(test.duration for test in self.tests)
+
+def testcase(test_fn):
+    """Wrap a suite test returning (status, message) with timing and result recording"""
+    @functools.wraps(test_fn)
+    async def wrapper(self):
+        start_time = time.perf_counter()
+        
+        try:
+            status, message = await test_fn(self)
+        except Exception as e:
+            status, message = "ERROR", str(e)
+        
+        self.suite.tests.append(TestResult(test_fn.__name__, status, time.perf_counter() - start_time, message))
+    
+    return wrapper
+
+
+async def bounded_gather(coros: Iterable, limit: int = 20, return_exceptions: bool = False) -> list:
+    """Gather coroutines with at most `limit` in flight at once"""
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def _bounded(coro):
+        async with semaphore:
+            return await coro
+    
+    return await asyncio.gather(*[_bounded(coro) for coro in coros], return_exceptions=return_exceptions)
@@ -5,15 +5,193 @@ Tests for Cross-Origin Resource Sharing and comprehensive error handling
 """
 
 import asyncio
-import json
+import socket
 import time
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, AsyncIterator, Optional
 import aiohttp
 import random
+import re
 import string
 
-from test_base import TestSuite as BaseTestSuite, TestResult
+from test_base import TestSuite as BaseTestSuite, TestResult, NO_HEADERS, json_dumps, json_loads, testcase
+
+# Origins the API is expected to allow
+_VALID_ORIGINS = (
+    'http://robot-puzzle-game-prod-website.s3-website-us-east-1.amazonaws.com',
+    'https://robot-puzzle-game-prod-website.s3-website-us-east-1.amazonaws.com'
+)
+_VALID_ORIGINS_SET = frozenset(_VALID_ORIGINS)
+
+# Origins to test CORS with
+_TEST_ORIGINS = _VALID_ORIGINS + (
+    'http://localhost:3000',
+    'http://localhost:8080',
+    'https://localhost:3000',
+    'https://example.com',
+    'http://malicious-site.com',
+    'null',  # File protocol
+    ''  # Empty origin
+)
+
+# Headers every successful preflight response must carry
+_REQUIRED_CORS_HEADERS = frozenset({
+    'access-control-allow-origin',
+    'access-control-allow-methods',
+    'access-control-allow-headers'
+})
+
+# Fields that mark a JSON body as a structured error
+_ERR_KEYS = frozenset({'error', 'message', 'errors'})
+
+# Fields holding a human-readable error string, in order of preference
+_ERR_MESSAGE_KEYS = ('error', 'message')
+
+# Acceptable status codes per error probe
+_AUTH_STATUSES = frozenset({401, 403})
+_BAD_REQUEST_STATUSES = frozenset({400, 401, 403})
+_NOT_ALLOWED_FALLBACK_STATUSES = frozenset({401, 403, 404})
+_TOO_LARGE_STATUSES = frozenset({413, 400, 401, 403})
+_MEDIA_TYPE_STATUSES = frozenset({415, 400, 401, 403})
+_MISSING_HEADER_STATUSES = frozenset({200, 201, 400, 401, 403})
+_LONG_URL_STATUSES = frozenset({400, 401, 403, 404, 414})  # 414 = URI Too Long
+_INVALID_METHOD_STATUSES = frozenset({400, 405, 501})
+
+# Keywords that make an auth error message actionable
+_HELPFUL_RE = re.compile(r'unauthorized|authentication|token|login|access', re.IGNORECASE)
+
+# Endpoints to test
+_TEST_ENDPOINTS = (
+    '/configurations',
+    '/rounds',
+    '/scores',
+    '/user/profile',
+    '/rounds/solved',
+    '/rounds/baseline',
+    '/rounds/user-submitted'
+)
+
+# Content types the API should refuse for configuration bodies
+_UNSUPPORTED_TYPES = (
+    'text/plain',
+    'application/xml',
+    'multipart/form-data',
+    'application/x-www-form-urlencoded',
+    'image/jpeg',
+    'text/html',
+    'application/octet-stream'
+)
+
+# Genuinely nested 256 levels deep, unlike repeating a flat object, and left
+# one closing brace short so the body is malformed rather than merely deep
+_DEEP_JSON = (b'{"a":' * 256) + b'1' + (b'}' * 255)
+
+# Request bodies that are not valid JSON
+_MALFORMED_JSONS = (
+    b'{"incomplete": ',
+    b'{"trailing": "comma",}',
+    b'{unquoted: "keys"}',
+    b'{"duplicate": "key", "duplicate": "value"}',
+    '{"unicode": "\uFFFF"}'.encode(),
+    _DEEP_JSON,  # Very deep nesting, unterminated
+)
+
+# Broken or unusual Content-Type header values
+_INVALID_CONTENT_TYPES = (
+    '',  # Empty
+    'invalid',  # Not a valid MIME type
+    'application/',  # Incomplete
+    'text/plain; charset=invalid',  # Invalid charset
+    'application/json; boundary=something',  # Wrong parameter
+    'APPLICATION/JSON',  # Case sensitivity
+)
+
+# One shared, read-only Content-Type header dict per media type probed
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+_HEADERS_BY_CT = {
+    content_type: {'Content-Type': content_type}
+    for content_type in _UNSUPPORTED_TYPES + _INVALID_CONTENT_TYPES
+}
+
+# Request header sets missing commonly required headers
+_HEADER_TESTS = (
+    {},  # No headers
+    {'Content-Type': 'application/json'},  # No Origin
+    {'Origin': 'http://example.com'},  # No Content-Type for POST
+    {'Accept': 'application/json'},  # Missing other headers
+)
+
+# Paths with extremely long IDs or query strings
+_LONG_URLS = (
+    '/configurations/' + 'x' * 1000,  # Very long ID
+    '/rounds/' + 'a' * 2000,  # Even longer ID
+    '/scores/' + '?' + '&'.join([f'param{i}=value{i}' for i in range(100)]),  # Many query params
+    '/user/profile' + '?' + 'x' * 5000,  # Very long query string
+)
+
+# Completely invalid HTTP methods
+_INVALID_METHODS = (
+    'INVALID',
+    'HACK',
+    'EXPLOIT',
+    'TEST',
+    '',  # Empty method
+    'get',  # Lowercase (should be uppercase)
+    'G E T',  # Spaces
+    'GET/POST',  # Multiple methods
+)
+
+# Any character outside the RFC 7230 token set makes the HTTP client refuse
+# the method locally, so those cases never reach the server
+_NON_TOKEN_RE = re.compile(r"[^!#$%&'*+\-.^_`|~0-9A-Za-z]")
+_CLIENT_INVALID_METHODS = frozenset(m for m in _INVALID_METHODS if _NON_TOKEN_RE.search(m))
+_SERVER_INVALID_METHODS = tuple(m for m in _INVALID_METHODS if m not in _CLIENT_INVALID_METHODS)
+
+# Pre-encoded request bodies, sent as-is without a per-request str encode
+_TEST_DATA = b'test data'
+_EMPTY_JSON = b'{}'
+_TEST_JSON = json_dumps({'test': 'data'}).encode('utf-8')
+
+# Pre-encoded bodies for the server error probes
+_LONG_NAME_BODY = b''.join([b'{"name": "', b'x' * 100000, b'"}'])
+_NULL_VALUES_BODY = b'{"roundId": null, "moves": null}'
+
+# Oversized body for the 413 probe is streamed in fixed chunks
+_LARGE_BODY_SIZE = 10 * 1024 * 1024  # 10MB
+_STREAM_CHUNK = b'x' * 65536
+
+# Suite-wide ceiling on concurrent requests
+_MAX_IN_FLIGHT = 20
+
+
+async def _huge_stream(size: int) -> AsyncIterator[bytes]:
+    """Yield a ~`size` byte JSON body without ever holding it in memory"""
+    yield b'{"name": "Large Configuration", "data": "'
+    for _ in range(size // len(_STREAM_CHUNK)):
+        yield _STREAM_CHUNK
+    yield b'"}'
+
+
+async def _read_body(response: aiohttp.ClientResponse, expect_body: bool) -> Any:
+    """Drain the response body and decode it as JSON, falling back to text"""
+    # Always drain the body so the connection goes back to the pool
+    body = await response.read()
+    if not expect_body:
+        return None  # Caller only inspects status/headers
+    try:
+        return json_loads(body)
+    except ValueError:
+        return await response.text()
+
+
+def _threshold_result(passed: float, total: int, threshold_pct: float,
+                      pass_label: str, fail_label: str) -> tuple:
+    """Return (status, message) for a passed/total ratio against a percentage threshold"""
+    success_rate = (passed / total) * 100 if total > 0 else 0
+    if success_rate >= threshold_pct:
+        return "PASS", f"{pass_label}: {passed}/{total} ({success_rate:.1f}%)"
+    return "FAIL", f"{fail_label}: only {passed}/{total} ({success_rate:.1f}%)"
+
 
 class TestSuite:
     """CORS and Error Handling Test Suite"""
@@ -22,6 +200,45 @@ class TestSuite:
         self.config = config
         self.api_base_url = config.get('api_base_url', 'https://tdrzqioye7.execute-api.us-east-1.amazonaws.com/prod')
         self.suite = BaseTestSuite("CORS & Error Handling", "Tests for CORS compliance and comprehensive error handling")
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._preflight_cache: Dict[tuple, asyncio.Task] = {}
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._session_users = 0  # Nesting depth of async with; run() enters too
+        
+    async def __aenter__(self):
+        """Open the pooled HTTP session shared by every test"""
+        # Re-entrant: a caller's own `async with suite` around run() shares
+        # the session, and only the outermost exit closes it
+        if self._session is not None:
+            self._session_users += 1
+            return self
+        
+        # One pooled session for every probe in the suite instead of a
+        # fresh TCP+TLS handshake per request. IPv4 only: API Gateway is
+        # reachable over IPv4 and broken IPv6 paths stall connects for seconds.
+        connector = aiohttp.TCPConnector(
+            family=socket.AF_INET,
+            limit=200,
+            limit_per_host=50,
+            ttl_dns_cache=600,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+        # Cap in-flight requests across all concurrently running tests
+        self._sem = asyncio.Semaphore(_MAX_IN_FLIGHT)
+        self._session_users = 1
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close the shared HTTP session once the outermost user exits"""
+        self._session_users -= 1
+        if self._session_users == 0:
+            await self._session.close()
+            self._session = None
         
     async def run(self):
         """Run all CORS and error handling tests"""
@@ -32,35 +249,46 @@ class TestSuite:
             print(f"   {self.suite.description}")
         print(f"   {'─' * 60}")
         
-        # CORS tests
-        await self.test_cors_preflight_all_endpoints()
-        await self.test_cors_simple_requests()
-        await self.test_cors_with_credentials()
-        await self.test_cors_origin_validation()
-        await self.test_cors_method_validation()
-        await self.test_cors_header_validation()
-        await self.test_cors_max_age()
-        
-        # Error handling tests
-        await self.test_404_not_found()
-        await self.test_405_method_not_allowed()
-        await self.test_400_bad_request()
-        await self.test_500_internal_server_error()
-        await self.test_413_payload_too_large()
-        await self.test_415_unsupported_media_type()
-        await self.test_429_rate_limiting()
-        
-        # Error response structure tests
-        await self.test_error_response_structure()
-        await self.test_error_message_consistency()
-        await self.test_error_codes_mapping()
-        
-        # Edge cases and malformed requests
-        await self.test_malformed_json()
-        await self.test_invalid_content_type()
-        await self.test_missing_required_headers()
-        await self.test_extremely_long_urls()
-        await self.test_invalid_http_methods()
+        async with self:
+            # Every test is an independent I/O-bound probe, so overlap them;
+            # results are printed afterwards in dispatch order so output stays stable
+            tests = [
+                # CORS tests
+                self.test_cors_preflight_all_endpoints,
+                self.test_cors_simple_requests,
+                self.test_cors_with_credentials,
+                self.test_cors_origin_validation,
+                self.test_cors_method_validation,
+                self.test_cors_header_validation,
+                self.test_cors_max_age,
+                
+                # Error handling tests
+                self.test_404_not_found,
+                self.test_405_method_not_allowed,
+                self.test_400_bad_request,
+                self.test_500_internal_server_error,
+                self.test_413_payload_too_large,
+                self.test_415_unsupported_media_type,
+                self.test_429_rate_limiting,
+                
+                # Error response structure tests
+                self.test_error_response_structure,
+                self.test_error_message_consistency,
+                self.test_error_codes_mapping,
+                
+                # Edge cases and malformed requests
+                self.test_malformed_json,
+                self.test_invalid_content_type,
+                self.test_missing_required_headers,
+                self.test_extremely_long_urls,
+                self.test_invalid_http_methods,
+            ]
+            await asyncio.gather(*[test() for test in tests])
+        
+        order = {test.__name__: index for index, test in enumerate(tests)}
+        self.suite.tests.sort(key=lambda result: order.get(result.name, len(order)))
+        for result in self.suite.tests:
+            self._print_test_result(result)
         
         self.suite.end_time = datetime.now()
         self._print_suite_summary()
@@ -93,979 +321,597 @@ class TestSuite:
         print()
 
     async def _make_request(self, method: str, endpoint: str, headers: Dict = None, data: Dict = None, 
-                           expect_cors: bool = False, raw_body: str = None) -> tuple:
+                           expect_cors: bool = False,
+                           raw_body_bytes: bytes = None,
+                           body_stream: AsyncIterator[bytes] = None,
+                           expect_body: bool = True) -> tuple:
         """Make HTTP request and return (status, response, duration, response_headers)"""
         url = f"{self.api_base_url}{endpoint}"
         request_headers = headers or {}
         
-        start_time = time.time()
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                # Prepare request data
-                if raw_body is not None:
-                    request_data = raw_body
-                elif data is not None:
-                    request_data = json.dumps(data)
-                else:
-                    request_data = None
-                
-                async with session.request(
-                    method=method,
-                    url=url,
-                    headers=request_headers,
-                    data=request_data,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    duration = time.time() - start_time
-                    
-                    try:
-                        response_data = await response.json()
-                    except:
-                        response_data = await response.text()
-                    
-                    return response.status, response_data, duration, dict(response.headers)
-                    
-        except Exception as e:
-            duration = time.time() - start_time
-            return None, str(e), duration, {}
+        # Prepare request data
+        if body_stream is not None:
+            request_data = body_stream  # Sent with chunked transfer encoding
+        elif raw_body_bytes is not None:
+            request_data = raw_body_bytes
+        elif data is not None:
+            request_data = json_dumps(data).encode('utf-8')
+        else:
+            request_data = None
+        
+        # Preflights are idempotent, so each (endpoint, origin, method, headers)
+        # tuple is probed once per run; concurrent callers share the request
+        if method == 'OPTIONS':
+            key = (
+                endpoint,
+                request_headers.get('Origin'),
+                request_headers.get('Access-Control-Request-Method'),
+                request_headers.get('Access-Control-Request-Headers'),
+                expect_body
+            )
+            cached = self._preflight_cache.get(key)
+            if cached is not None:
+                status, response_data, req_duration, resp_headers = await cached
+                return status, response_data, 0.0, resp_headers
+            
+            self._preflight_cache[key] = asyncio.ensure_future(
+                self._send_request(method, url, request_headers, request_data, expect_body)
+            )
+            return await self._preflight_cache[key]
+        
+        return await self._send_request(method, url, request_headers, request_data, expect_body)
 
-    def _get_test_origins(self) -> List[str]:
-        """Get list of origins to test CORS with"""
-        return [
-            'http://robot-puzzle-game-prod-website.s3-website-us-east-1.amazonaws.com',
-            'https://robot-puzzle-game-prod-website.s3-website-us-east-1.amazonaws.com',
-            'http://localhost:3000',
-            'http://localhost:8080',
-            'https://localhost:3000',
-            'https://example.com',
-            'http://malicious-site.com',
-            'null',  # File protocol
-            ''  # Empty origin
-        ]
+    async def _send_request(self, method: str, url: str, request_headers: Dict, request_data,
+                            expect_body: bool = True, bounded: bool = True) -> tuple:
+        """Send a request on the shared session and return (status, response, duration, response_headers)
 
-    def _get_test_endpoints(self) -> List[str]:
-        """Get list of endpoints to test"""
-        return [
-            '/configurations',
-            '/rounds',
-            '/scores',
-            '/user/profile',
-            '/rounds/solved',
-            '/rounds/baseline',
-            '/rounds/user-submitted'
-        ]
+        With bounded=False the request skips the suite-wide in-flight cap, for
+        bursts that must reach the server all at once.
+        """
+        if not bounded:
+            return await self._dispatch(method, url, request_headers, request_data, expect_body)
+        
+        async with self._sem:
+            return await self._dispatch(method, url, request_headers, request_data, expect_body)
 
-    async def test_cors_preflight_all_endpoints(self):
-        """Test CORS preflight requests for all endpoints"""
-        start_time = time.time()
+    async def _dispatch(self, method: str, url: str, request_headers: Dict, request_data,
+                        expect_body: bool) -> tuple:
+        """Issue one request, timed from dispatch"""
+        start_time = time.perf_counter()
         
         try:
-            endpoints = self._get_test_endpoints()
-            valid_origins = [
-                'http://robot-puzzle-game-prod-website.s3-website-us-east-1.amazonaws.com',
-                'https://robot-puzzle-game-prod-website.s3-website-us-east-1.amazonaws.com'
-            ]
-            
-            successful_preflights = 0
-            total_tests = len(endpoints) * len(valid_origins)
-            
-            for endpoint in endpoints:
-                for origin in valid_origins:
-                    headers = {
-                        'Origin': origin,
-                        'Access-Control-Request-Method': 'GET',
-                        'Access-Control-Request-Headers': 'authorization,content-type'
-                    }
+            async with self._session.request(
+                method=method,
+                url=url,
+                headers=request_headers,
+                data=request_data
+            ) as response:
+                duration = time.perf_counter() - start_time
+                response_data = await _read_body(response, expect_body)
+                return response.status, response_data, duration, response.headers
                     
-                    status, response, req_duration, resp_headers = await self._make_request('OPTIONS', endpoint, headers)
-                    
-                    if status == 200:
-                        # Check for required CORS headers
-                        cors_headers = [
-                            'access-control-allow-origin',
-                            'access-control-allow-methods',
-                            'access-control-allow-headers'
-                        ]
-                        
-                        has_cors_headers = all(
-                            header in [h.lower() for h in resp_headers.keys()] 
-                            for header in cors_headers
-                        )
-                        
-                        if has_cors_headers:
-                            successful_preflights += 1
-            
-            duration = time.time() - start_time
-            success_rate = (successful_preflights / total_tests) * 100 if total_tests > 0 else 0
-            
-            if success_rate >= 70:  # At least 70% should work
-                result = TestResult("test_cors_preflight_all_endpoints", "PASS", duration, 
-                                  f"CORS preflight working: {successful_preflights}/{total_tests} ({success_rate:.1f}%)")
-            else:
-                result = TestResult("test_cors_preflight_all_endpoints", "FAIL", duration, 
-                                  f"CORS preflight poor coverage: {successful_preflights}/{total_tests} ({success_rate:.1f}%)")
-            
         except Exception as e:
-            duration = time.time() - start_time
-            result = TestResult("test_cors_preflight_all_endpoints", "ERROR", duration, str(e))
-        
-        self.suite.tests.append(result)
-        self._print_test_result(result)
+            duration = time.perf_counter() - start_time
+            return None, str(e), duration, NO_HEADERS
+
+    @testcase
+    async def test_cors_preflight_all_endpoints(self):
+        """Test CORS preflight requests for all endpoints"""
+        total_tests = len(_TEST_ENDPOINTS) * len(_VALID_ORIGINS)
+        
+        # One request header dict per origin, shared across every endpoint
+        base_headers = {
+            'Access-Control-Request-Method': 'GET',
+            'Access-Control-Request-Headers': 'authorization,content-type'
+        }
+        origin_headers = [{**base_headers, 'Origin': origin} for origin in _VALID_ORIGINS]
+        
+        responses = await asyncio.gather(*[
+            self._make_request('OPTIONS', endpoint, headers, expect_body=False)
+            for endpoint in _TEST_ENDPOINTS
+            for headers in origin_headers
+        ])
+        
+        # Superset check on the CIMultiDictProxy keys view is case-insensitive
+        # (frozenset.issubset would copy the keys into a case-sensitive set)
+        successful_preflights = sum(
+            1 for status, response, req_duration, resp_headers in responses
+            if status == 200 and resp_headers.keys() >= _REQUIRED_CORS_HEADERS
+        )
+        
+        # At least 70% should work
+        return _threshold_result(successful_preflights, total_tests, 70,
+                                 "CORS preflight working", "CORS preflight poor coverage")
 
+    @testcase
     async def test_cors_simple_requests(self):
         """Test CORS simple requests (GET with simple headers)"""
-        start_time = time.time()
+        valid_origin = 'http://robot-puzzle-game-prod-website.s3-website-us-east-1.amazonaws.com'
         
-        try:
-            valid_origin = 'http://robot-puzzle-game-prod-website.s3-website-us-east-1.amazonaws.com'
-            
-            headers = {
-                'Origin': valid_origin,
-                'Accept': 'application/json'
-            }
-            
-            status, response, req_duration, resp_headers = await self._make_request('GET', '/configurations', headers)
-            
-            # Check if Access-Control-Allow-Origin is present in response
-            cors_origin = resp_headers.get('access-control-allow-origin') or resp_headers.get('Access-Control-Allow-Origin')
-            
-            duration = time.time() - start_time
-            if cors_origin:
-                result = TestResult("test_cors_simple_requests", "PASS", duration, 
-                                  f"CORS simple request working, origin: {cors_origin}")
-            else:
-                result = TestResult("test_cors_simple_requests", "FAIL", duration, 
-                                  "CORS simple request missing Access-Control-Allow-Origin header")
-            
-        except Exception as e:
-            duration = time.time() - start_time
-            result = TestResult("test_cors_simple_requests", "ERROR", duration, str(e))
+        headers = {
+            'Origin': valid_origin,
+            'Accept': 'application/json'
+        }
         
-        self.suite.tests.append(result)
-        self._print_test_result(result)
+        status, response, req_duration, resp_headers = await self._make_request('GET', '/configurations', headers, expect_body=False)
+        
+        # Check if Access-Control-Allow-Origin is present in response
+        cors_origin = resp_headers.get('access-control-allow-origin')
+        
+        if cors_origin:
+            return "PASS", f"CORS simple request working, origin: {cors_origin}"
+        else:
+            return "FAIL", "CORS simple request missing Access-Control-Allow-Origin header"
 
+    @testcase
     async def test_cors_with_credentials(self):
         """Test CORS requests with credentials"""
-        start_time = time.time()
+        valid_origin = 'http://robot-puzzle-game-prod-website.s3-website-us-east-1.amazonaws.com'
         
-        try:
-            valid_origin = 'http://robot-puzzle-game-prod-website.s3-website-us-east-1.amazonaws.com'
-            
-            headers = {
-                'Origin': valid_origin,
-                'Authorization': 'Bearer test-token'
-            }
-            
-            status, response, req_duration, resp_headers = await self._make_request('GET', '/configurations', headers)
-            
-            # Check CORS headers related to credentials
-            allow_credentials = resp_headers.get('access-control-allow-credentials') or resp_headers.get('Access-Control-Allow-Credentials')
-            allow_origin = resp_headers.get('access-control-allow-origin') or resp_headers.get('Access-Control-Allow-Origin')
-            
-            duration = time.time() - start_time
-            if allow_origin and (allow_credentials == 'true' or allow_origin != '*'):
-                result = TestResult("test_cors_with_credentials", "PASS", duration, 
-                                  f"CORS credentials handling appropriate: credentials={allow_credentials}, origin={allow_origin}")
-            else:
-                result = TestResult("test_cors_with_credentials", "FAIL", duration, 
-                                  f"CORS credentials handling issue: credentials={allow_credentials}, origin={allow_origin}")
-            
-        except Exception as e:
-            duration = time.time() - start_time
-            result = TestResult("test_cors_with_credentials", "ERROR", duration, str(e))
+        headers = {
+            'Origin': valid_origin,
+            'Authorization': 'Bearer test-token'
+        }
+        
+        status, response, req_duration, resp_headers = await self._make_request('GET', '/configurations', headers, expect_body=False)
+        
+        # Check CORS headers related to credentials
+        allow_credentials = resp_headers.get('access-control-allow-credentials')
+        allow_origin = resp_headers.get('access-control-allow-origin')
         
-        self.suite.tests.append(result)
-        self._print_test_result(result)
+        if allow_origin and (allow_credentials == 'true' or allow_origin != '*'):
+            return "PASS", f"CORS credentials handling appropriate: credentials={allow_credentials}, origin={allow_origin}"
+        else:
+            return "FAIL", f"CORS credentials handling issue: credentials={allow_credentials}, origin={allow_origin}"
 
+    @testcase
     async def test_cors_origin_validation(self):
         """Test CORS origin validation"""
-        start_time = time.time()
+        test_origins = _TEST_ORIGINS
+        results = {}
+        
+        responses = await asyncio.gather(*[
+            self._make_request('OPTIONS', '/configurations', {'Origin': origin}, expect_body=False)
+            for origin in test_origins
+        ])
+        
+        for origin, (status, response, req_duration, resp_headers) in zip(test_origins, responses):
+            allow_origin = resp_headers.get('access-control-allow-origin')
+            results[origin] = {
+                'status': status,
+                'allowed_origin': allow_origin
+            }
         
-        try:
-            test_origins = self._get_test_origins()
-            results = {}
-            
-            for origin in test_origins:
-                headers = {'Origin': origin}
-                status, response, req_duration, resp_headers = await self._make_request('OPTIONS', '/configurations', headers)
-                
-                allow_origin = resp_headers.get('access-control-allow-origin') or resp_headers.get('Access-Control-Allow-Origin')
-                results[origin] = {
-                    'status': status,
-                    'allowed_origin': allow_origin
-                }
-            
-            # Analyze results
-            valid_origins = [
-                'http://robot-puzzle-game-prod-website.s3-website-us-east-1.amazonaws.com',
-                'https://robot-puzzle-game-prod-website.s3-website-us-east-1.amazonaws.com'
-            ]
-            
-            correctly_allowed = 0
-            correctly_rejected = 0
-            
-            for origin, result in results.items():
-                if origin in valid_origins and result['allowed_origin']:
-                    correctly_allowed += 1
-                elif origin not in valid_origins and not result['allowed_origin']:
-                    correctly_rejected += 1
-            
-            duration = time.time() - start_time
-            total_correct = correctly_allowed + correctly_rejected
-            
-            if total_correct >= len(test_origins) * 0.7:  # 70% correct handling
-                result = TestResult("test_cors_origin_validation", "PASS", duration, 
-                                  f"Origin validation working: {total_correct}/{len(test_origins)} correct")
-            else:
-                result = TestResult("test_cors_origin_validation", "FAIL", duration, 
-                                  f"Origin validation issues: only {total_correct}/{len(test_origins)} correct")
-            
-        except Exception as e:
-            duration = time.time() - start_time
-            result = TestResult("test_cors_origin_validation", "ERROR", duration, str(e))
+        # Analyze results: valid origins must be allowed, all others rejected
+        total_correct = sum(
+            1 for origin, result in results.items()
+            if (origin in _VALID_ORIGINS_SET) == bool(result['allowed_origin'])
+        )
         
-        self.suite.tests.append(result)
-        self._print_test_result(result)
+        if total_correct >= len(test_origins) * 0.7:  # 70% correct handling
+            return "PASS", f"Origin validation working: {total_correct}/{len(test_origins)} correct"
+        else:
+            return "FAIL", f"Origin validation issues: only {total_correct}/{len(test_origins)} correct"
 
+    @testcase
     async def test_cors_method_validation(self):
         """Test CORS method validation"""
-        start_time = time.time()
+        valid_origin = 'http://robot-puzzle-game-prod-website.s3-website-us-east-1.amazonaws.com'
+        test_methods = ['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'CONNECT', 'TRACE']
         
-        try:
-            valid_origin = 'http://robot-puzzle-game-prod-website.s3-website-us-east-1.amazonaws.com'
-            test_methods = ['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'CONNECT', 'TRACE']
-            
-            allowed_methods = []
-            
-            for method in test_methods:
-                headers = {
-                    'Origin': valid_origin,
-                    'Access-Control-Request-Method': method,
-                    'Access-Control-Request-Headers': 'content-type'
-                }
-                
-                status, response, req_duration, resp_headers = await self._make_request('OPTIONS', '/configurations', headers)
-                
-                if status == 200:
-                    allow_methods = resp_headers.get('access-control-allow-methods') or resp_headers.get('Access-Control-Allow-Methods')
-                    if allow_methods and method.upper() in allow_methods.upper():
-                        allowed_methods.append(method)
-            
-            duration = time.time() - start_time
-            
-            # Should at least allow GET and POST
-            required_methods = ['GET', 'POST']
-            has_required = all(method in allowed_methods for method in required_methods)
-            
-            if has_required:
-                result = TestResult("test_cors_method_validation", "PASS", duration, 
-                                  f"CORS method validation working: {len(allowed_methods)} methods allowed")
-            else:
-                result = TestResult("test_cors_method_validation", "FAIL", duration, 
-                                  f"CORS method validation issues: only {allowed_methods} allowed")
-            
-        except Exception as e:
-            duration = time.time() - start_time
-            result = TestResult("test_cors_method_validation", "ERROR", duration, str(e))
+        allowed_methods = []
         
-        self.suite.tests.append(result)
-        self._print_test_result(result)
+        responses = await asyncio.gather(*[
+            self._make_request('OPTIONS', '/configurations', {
+                'Origin': valid_origin,
+                'Access-Control-Request-Method': method,
+                'Access-Control-Request-Headers': 'content-type'
+            }, expect_body=False)
+            for method in test_methods
+        ])
+        
+        for method, (status, response, req_duration, resp_headers) in zip(test_methods, responses):
+            if status == 200:
+                allow_methods = resp_headers.get('access-control-allow-methods')
+                if allow_methods and method.upper() in allow_methods.upper():
+                    allowed_methods.append(method)
+        
+        # Should at least allow GET and POST
+        required_methods = ['GET', 'POST']
+        has_required = all(method in allowed_methods for method in required_methods)
+        
+        if has_required:
+            return "PASS", f"CORS method validation working: {len(allowed_methods)} methods allowed"
+        else:
+            return "FAIL", f"CORS method validation issues: only {allowed_methods} allowed"
 
+    @testcase
     async def test_cors_header_validation(self):
         """Test CORS header validation"""
-        start_time = time.time()
+        valid_origin = 'http://robot-puzzle-game-prod-website.s3-website-us-east-1.amazonaws.com'
+        test_headers = [
+            'authorization',
+            'content-type',
+            'accept',
+            'x-requested-with',
+            'x-custom-header',
+            'x-dangerous-header'
+        ]
         
-        try:
-            valid_origin = 'http://robot-puzzle-game-prod-website.s3-website-us-east-1.amazonaws.com'
-            test_headers = [
-                'authorization',
-                'content-type',
-                'accept',
-                'x-requested-with',
-                'x-custom-header',
-                'x-dangerous-header'
-            ]
-            
-            allowed_headers = []
-            
-            for header in test_headers:
-                headers = {
-                    'Origin': valid_origin,
-                    'Access-Control-Request-Method': 'POST',
-                    'Access-Control-Request-Headers': header
-                }
-                
-                status, response, req_duration, resp_headers = await self._make_request('OPTIONS', '/configurations', headers)
-                
-                if status == 200:
-                    allow_headers = resp_headers.get('access-control-allow-headers') or resp_headers.get('Access-Control-Allow-Headers')
-                    if allow_headers and header.lower() in allow_headers.lower():
-                        allowed_headers.append(header)
-            
-            duration = time.time() - start_time
-            
-            # Should at least allow authorization and content-type
-            required_headers = ['authorization', 'content-type']
-            has_required = all(header in allowed_headers for header in required_headers)
-            
-            if has_required:
-                result = TestResult("test_cors_header_validation", "PASS", duration, 
-                                  f"CORS header validation working: {len(allowed_headers)} headers allowed")
-            else:
-                result = TestResult("test_cors_header_validation", "FAIL", duration, 
-                                  f"CORS header validation issues: only {allowed_headers} allowed")
-            
-        except Exception as e:
-            duration = time.time() - start_time
-            result = TestResult("test_cors_header_validation", "ERROR", duration, str(e))
+        allowed_headers = []
         
-        self.suite.tests.append(result)
-        self._print_test_result(result)
+        responses = await asyncio.gather(*[
+            self._make_request('OPTIONS', '/configurations', {
+                'Origin': valid_origin,
+                'Access-Control-Request-Method': 'POST',
+                'Access-Control-Request-Headers': header
+            }, expect_body=False)
+            for header in test_headers
+        ])
+        
+        for header, (status, response, req_duration, resp_headers) in zip(test_headers, responses):
+            if status == 200:
+                allow_headers = resp_headers.get('access-control-allow-headers')
+                if allow_headers and header.lower() in allow_headers.lower():
+                    allowed_headers.append(header)
+        
+        # Should at least allow authorization and content-type
+        required_headers = ['authorization', 'content-type']
+        has_required = all(header in allowed_headers for header in required_headers)
+        
+        if has_required:
+            return "PASS", f"CORS header validation working: {len(allowed_headers)} headers allowed"
+        else:
+            return "FAIL", f"CORS header validation issues: only {allowed_headers} allowed"
 
+    @testcase
     async def test_cors_max_age(self):
         """Test CORS max-age header"""
-        start_time = time.time()
+        valid_origin = 'http://robot-puzzle-game-prod-website.s3-website-us-east-1.amazonaws.com'
         
-        try:
-            valid_origin = 'http://robot-puzzle-game-prod-website.s3-website-us-east-1.amazonaws.com'
-            
-            headers = {
-                'Origin': valid_origin,
-                'Access-Control-Request-Method': 'POST',
-                'Access-Control-Request-Headers': 'authorization,content-type'
-            }
-            
-            status, response, req_duration, resp_headers = await self._make_request('OPTIONS', '/configurations', headers)
-            
-            max_age = resp_headers.get('access-control-max-age') or resp_headers.get('Access-Control-Max-Age')
-            
-            duration = time.time() - start_time
-            if max_age:
-                try:
-                    max_age_value = int(max_age)
-                    if 0 <= max_age_value <= 86400:  # Reasonable range (0 to 24 hours)
-                        result = TestResult("test_cors_max_age", "PASS", duration, 
-                                          f"CORS max-age header present: {max_age} seconds")
-                    else:
-                        result = TestResult("test_cors_max_age", "FAIL", duration, 
-                                          f"CORS max-age value unreasonable: {max_age}")
-                except ValueError:
-                    result = TestResult("test_cors_max_age", "FAIL", duration, 
-                                      f"CORS max-age not a valid number: {max_age}")
-            else:
-                result = TestResult("test_cors_max_age", "PASS", duration, 
-                                  "CORS max-age header not set (browsers will use default)")
-            
-        except Exception as e:
-            duration = time.time() - start_time
-            result = TestResult("test_cors_max_age", "ERROR", duration, str(e))
+        headers = {
+            'Origin': valid_origin,
+            'Access-Control-Request-Method': 'POST',
+            'Access-Control-Request-Headers': 'authorization,content-type'
+        }
+        
+        status, response, req_duration, resp_headers = await self._make_request('OPTIONS', '/configurations', headers, expect_body=False)
         
-        self.suite.tests.append(result)
-        self._print_test_result(result)
+        max_age = resp_headers.get('access-control-max-age')
+        
+        if max_age:
+            try:
+                max_age_value = int(max_age)
+                if 0 <= max_age_value <= 86400:  # Reasonable range (0 to 24 hours)
+                    return "PASS", f"CORS max-age header present: {max_age} seconds"
+                else:
+                    return "FAIL", f"CORS max-age value unreasonable: {max_age}"
+            except ValueError:
+                return "FAIL", f"CORS max-age not a valid number: {max_age}"
+        else:
+            return "PASS", "CORS max-age header not set (browsers will use default)"
 
+    @testcase
     async def test_404_not_found(self):
         """Test 404 Not Found responses"""
-        start_time = time.time()
+        not_found_urls = [
+            '/nonexistent',
+            '/configurations/does-not-exist',
+            '/rounds/invalid-round-id',
+            '/scores/nonexistent-round',
+            '/user/nonexistent',
+            '/api/v2/configurations',  # Wrong API version
+            '/configurations/../../etc/passwd'  # Path traversal attempt
+        ]
         
-        try:
-            not_found_urls = [
-                '/nonexistent',
-                '/configurations/does-not-exist',
-                '/rounds/invalid-round-id',
-                '/scores/nonexistent-round',
-                '/user/nonexistent',
-                '/api/v2/configurations',  # Wrong API version
-                '/configurations/../../etc/passwd'  # Path traversal attempt
-            ]
-            
-            proper_404s = 0
-            
-            for url in not_found_urls:
-                status, response, req_duration, resp_headers = await self._make_request('GET', url)
-                
-                if status == 404:
-                    proper_404s += 1
-                elif status in [401, 403]:  # Also acceptable (auth required first)
-                    proper_404s += 0.5  # Partial credit
-            
-            duration = time.time() - start_time
-            success_rate = (proper_404s / len(not_found_urls)) * 100
-            
-            if success_rate >= 70:
-                result = TestResult("test_404_not_found", "PASS", duration, 
-                                  f"404 handling working: {proper_404s}/{len(not_found_urls)} ({success_rate:.1f}%)")
-            else:
-                result = TestResult("test_404_not_found", "FAIL", duration, 
-                                  f"404 handling issues: only {proper_404s}/{len(not_found_urls)} ({success_rate:.1f}%)")
-            
-        except Exception as e:
-            duration = time.time() - start_time
-            result = TestResult("test_404_not_found", "ERROR", duration, str(e))
+        responses = await asyncio.gather(*[
+            self._make_request('GET', url, expect_body=False) for url in not_found_urls
+        ])
         
-        self.suite.tests.append(result)
-        self._print_test_result(result)
+        # Auth rejections are also acceptable (auth required first) for partial credit
+        proper_404s = sum(
+            1 if status == 404 else 0.5 if status in _AUTH_STATUSES else 0
+            for status, response, req_duration, resp_headers in responses
+        )
+        
+        return _threshold_result(proper_404s, len(not_found_urls), 70,
+                                 "404 handling working", "404 handling issues")
 
+    @testcase
     async def test_405_method_not_allowed(self):
         """Test 405 Method Not Allowed responses"""
-        start_time = time.time()
+        # Test unsupported methods on known endpoints
+        method_tests = [
+            ('PATCH', '/configurations'),
+            ('DELETE', '/scores'),
+            ('HEAD', '/user/profile'),
+            ('TRACE', '/rounds'),
+            ('CONNECT', '/configurations')
+        ]
         
-        try:
-            # Test unsupported methods on known endpoints
-            method_tests = [
-                ('PATCH', '/configurations'),
-                ('DELETE', '/scores'),
-                ('HEAD', '/user/profile'),
-                ('TRACE', '/rounds'),
-                ('CONNECT', '/configurations')
-            ]
-            
-            proper_405s = 0
-            
-            for method, endpoint in method_tests:
-                status, response, req_duration, resp_headers = await self._make_request(method, endpoint)
-                
-                if status == 405:
-                    proper_405s += 1
-                elif status in [401, 403, 404]:  # Also acceptable
-                    proper_405s += 0.5  # Partial credit
-            
-            duration = time.time() - start_time
-            success_rate = (proper_405s / len(method_tests)) * 100
-            
-            if success_rate >= 50:  # Lower threshold as some methods might be supported
-                result = TestResult("test_405_method_not_allowed", "PASS", duration, 
-                                  f"405 handling working: {proper_405s}/{len(method_tests)} ({success_rate:.1f}%)")
-            else:
-                result = TestResult("test_405_method_not_allowed", "FAIL", duration, 
-                                  f"405 handling issues: only {proper_405s}/{len(method_tests)} ({success_rate:.1f}%)")
-            
-        except Exception as e:
-            duration = time.time() - start_time
-            result = TestResult("test_405_method_not_allowed", "ERROR", duration, str(e))
+        responses = await asyncio.gather(*[
+            self._make_request(method, endpoint) for method, endpoint in method_tests
+        ])
+        
+        # Fallback statuses are also acceptable for partial credit
+        proper_405s = sum(
+            1 if status == 405 else 0.5 if status in _NOT_ALLOWED_FALLBACK_STATUSES else 0
+            for status, response, req_duration, resp_headers in responses
+        )
         
-        self.suite.tests.append(result)
-        self._print_test_result(result)
+        # Lower threshold as some methods might be supported
+        return _threshold_result(proper_405s, len(method_tests), 50,
+                                 "405 handling working", "405 handling issues")
 
+    @testcase
     async def test_400_bad_request(self):
         """Test 400 Bad Request responses"""
-        start_time = time.time()
+        # Test various bad requests
+        bad_requests = [
+            ('POST', '/configurations', _JSON_HEADERS, b'{"invalid": json}'),  # Invalid JSON
+            ('POST', '/rounds', _JSON_HEADERS, _EMPTY_JSON),  # Empty object
+            ('PUT', '/user/profile', _JSON_HEADERS, b'{"username": 123}'),  # Wrong type
+            ('POST', '/scores', _JSON_HEADERS, b'{"moves": -1}'),  # Invalid value
+        ]
         
-        try:
-            # Test various bad requests
-            bad_requests = [
-                ('POST', '/configurations', {'Content-Type': 'application/json'}, '{"invalid": json}'),  # Invalid JSON
-                ('POST', '/rounds', {'Content-Type': 'application/json'}, '{}'),  # Empty object
-                ('PUT', '/user/profile', {'Content-Type': 'application/json'}, '{"username": 123}'),  # Wrong type
-                ('POST', '/scores', {'Content-Type': 'application/json'}, '{"moves": -1}'),  # Invalid value
-            ]
-            
-            proper_400s = 0
-            
-            for method, endpoint, headers, body in bad_requests:
-                status, response, req_duration, resp_headers = await self._make_request(method, endpoint, headers, raw_body=body)
-                
-                if status == 400:
-                    proper_400s += 1
-                elif status in [401, 403]:  # Auth might be checked first
-                    proper_400s += 0.5  # Partial credit
-            
-            duration = time.time() - start_time
-            success_rate = (proper_400s / len(bad_requests)) * 100
-            
-            if success_rate >= 50:
-                result = TestResult("test_400_bad_request", "PASS", duration, 
-                                  f"400 handling working: {proper_400s}/{len(bad_requests)} ({success_rate:.1f}%)")
-            else:
-                result = TestResult("test_400_bad_request", "FAIL", duration, 
-                                  f"400 handling issues: only {proper_400s}/{len(bad_requests)} ({success_rate:.1f}%)")
-            
-        except Exception as e:
-            duration = time.time() - start_time
-            result = TestResult("test_400_bad_request", "ERROR", duration, str(e))
+        responses = await asyncio.gather(*[
+            self._make_request(method, endpoint, headers, raw_body_bytes=body)
+            for method, endpoint, headers, body in bad_requests
+        ])
+        
+        # Auth might be checked first, which earns partial credit
+        proper_400s = sum(
+            1 if status == 400 else 0.5 if status in _AUTH_STATUSES else 0
+            for status, response, req_duration, resp_headers in responses
+        )
         
-        self.suite.tests.append(result)
-        self._print_test_result(result)
+        return _threshold_result(proper_400s, len(bad_requests), 50,
+                                 "400 handling working", "400 handling issues")
 
+    @testcase
     async def test_500_internal_server_error(self):
         """Test handling of potential server errors"""
-        start_time = time.time()
+        # Test requests that might trigger server errors
+        potential_500s = [
+            ('POST', '/configurations', _JSON_HEADERS, _LONG_NAME_BODY),  # Very large data
+            ('GET', '/rounds/' + 'x' * 1000, None, None),  # Very long ID
+            ('POST', '/scores', _JSON_HEADERS, _NULL_VALUES_BODY),  # Null values
+        ]
         
-        try:
-            # Test requests that might trigger server errors
-            potential_500s = [
-                ('POST', '/configurations', {'Content-Type': 'application/json'}, '{"name": "' + 'x' * 100000 + '"}'),  # Very large data
-                ('GET', '/rounds/' + 'x' * 1000),  # Very long ID
-                ('POST', '/scores', {'Content-Type': 'application/json'}, '{"roundId": null, "moves": null}'),  # Null values
-            ]
-            
-            no_500_errors = 0
-            
-            for method, endpoint, headers, body in potential_500s:
-                status, response, req_duration, resp_headers = await self._make_request(method, endpoint, headers, raw_body=body)
-                
-                # Should not return 500 (should handle gracefully with 400, 401, etc.)
-                if status != 500:
-                    no_500_errors += 1
-            
-            duration = time.time() - start_time
-            success_rate = (no_500_errors / len(potential_500s)) * 100
-            
-            if success_rate >= 80:
-                result = TestResult("test_500_internal_server_error", "PASS", duration, 
-                                  f"Server error handling good: {no_500_errors}/{len(potential_500s)} handled gracefully ({success_rate:.1f}%)")
-            else:
-                result = TestResult("test_500_internal_server_error", "FAIL", duration, 
-                                  f"Server error handling issues: only {no_500_errors}/{len(potential_500s)} handled gracefully ({success_rate:.1f}%)")
-            
-        except Exception as e:
-            duration = time.time() - start_time
-            result = TestResult("test_500_internal_server_error", "ERROR", duration, str(e))
+        responses = await asyncio.gather(*[
+            self._make_request(method, endpoint, headers, raw_body_bytes=body)
+            for method, endpoint, headers, body in potential_500s
+        ])
+        
+        # Should not return 500 (should handle gracefully with 400, 401, etc.)
+        no_500_errors = sum(1 for status, response, req_duration, resp_headers in responses if status != 500)
         
-        self.suite.tests.append(result)
-        self._print_test_result(result)
+        return _threshold_result(no_500_errors, len(potential_500s), 80,
+                                 "Server errors handled gracefully", "Server error handling issues")
 
+    @testcase
     async def test_413_payload_too_large(self):
         """Test 413 Payload Too Large responses"""
-        start_time = time.time()
-        
-        try:
-            # Create very large payloads
-            large_string = 'x' * (10 * 1024 * 1024)  # 10MB string
-            large_payload = {
-                'name': 'Large Configuration',
-                'data': large_string,
-                'walls': ['1,1,top'] * 100000,  # Many walls
-                'metadata': {f'field_{i}': large_string[:1000] for i in range(1000)}  # Many fields
-            }
-            
-            headers = {'Content-Type': 'application/json'}
-            status, response, req_duration, resp_headers = await self._make_request('POST', '/configurations', headers, large_payload)
-            
-            duration = time.time() - start_time
-            
-            # Should either reject with 413 or handle gracefully with other error codes
-            if status in [413, 400, 401, 403]:
-                result = TestResult("test_413_payload_too_large", "PASS", duration, 
-                                  f"Large payload handled appropriately (status: {status})")
-            elif status is None:
-                result = TestResult("test_413_payload_too_large", "PASS", duration, 
-                                  "Large payload rejected at network level (timeout/connection error)")
-            else:
-                result = TestResult("test_413_payload_too_large", "FAIL", duration, 
-                                  f"Large payload unexpected status: {status}")
-            
-        except Exception as e:
-            duration = time.time() - start_time
-            result = TestResult("test_413_payload_too_large", "ERROR", duration, str(e))
-        
-        self.suite.tests.append(result)
-        self._print_test_result(result)
+        # Stream a ~10MB body in 64KB chunks; peak memory stays at one chunk
+        headers = _JSON_HEADERS
+        status, response, req_duration, resp_headers = await self._make_request(
+            'POST', '/configurations', headers, body_stream=_huge_stream(_LARGE_BODY_SIZE)
+        )
+        
+        # Should either reject with 413 or handle gracefully with other error codes
+        if status in _TOO_LARGE_STATUSES:
+            return "PASS", f"Large payload handled appropriately (status: {status})"
+        elif status is None:
+            return "PASS", "Large payload rejected at network level (timeout/connection error)"
+        else:
+            return "FAIL", f"Large payload unexpected status: {status}"
 
+    @testcase
     async def test_415_unsupported_media_type(self):
         """Test 415 Unsupported Media Type responses"""
-        start_time = time.time()
         
-        try:
-            # Test various unsupported content types
-            unsupported_types = [
-                'text/plain',
-                'application/xml',
-                'multipart/form-data',
-                'application/x-www-form-urlencoded',
-                'image/jpeg',
-                'text/html',
-                'application/octet-stream'
-            ]
-            
-            proper_rejections = 0
-            
-            for content_type in unsupported_types:
-                headers = {'Content-Type': content_type}
-                data_body = 'test data'
-                
-                status, response, req_duration, resp_headers = await self._make_request('POST', '/configurations', headers, raw_body=data_body)
-                
-                if status in [415, 400, 401, 403]:  # Any appropriate rejection
-                    proper_rejections += 1
-            
-            duration = time.time() - start_time
-            success_rate = (proper_rejections / len(unsupported_types)) * 100
-            
-            if success_rate >= 70:
-                result = TestResult("test_415_unsupported_media_type", "PASS", duration, 
-                                  f"Media type validation working: {proper_rejections}/{len(unsupported_types)} ({success_rate:.1f}%)")
-            else:
-                result = TestResult("test_415_unsupported_media_type", "FAIL", duration, 
-                                  f"Media type validation issues: only {proper_rejections}/{len(unsupported_types)} ({success_rate:.1f}%)")
-            
-        except Exception as e:
-            duration = time.time() - start_time
-            result = TestResult("test_415_unsupported_media_type", "ERROR", duration, str(e))
+        results = await asyncio.gather(*[
+            self._make_request('POST', '/configurations', _HEADERS_BY_CT[content_type], raw_body_bytes=_TEST_DATA)
+            for content_type in _UNSUPPORTED_TYPES
+        ], return_exceptions=True)
+        
+        # Any appropriate rejection
+        proper_rejections = sum(
+            1 for r in results
+            if not isinstance(r, Exception) and r[0] in _MEDIA_TYPE_STATUSES
+        )
         
-        self.suite.tests.append(result)
-        self._print_test_result(result)
+        return _threshold_result(proper_rejections, len(_UNSUPPORTED_TYPES), 70,
+                                 "Media type validation working", "Media type validation issues")
 
+    @testcase
     async def test_429_rate_limiting(self):
         """Test 429 Too Many Requests (rate limiting)"""
-        start_time = time.time()
-        
-        try:
-            # Send many requests quickly
-            responses = []
-            
-            for i in range(20):
-                status, response, req_duration, resp_headers = await self._make_request('GET', '/configurations')
-                responses.append(status)
-                
-                # Very small delay
-                await asyncio.sleep(0.05)
-            
-            # Check if any rate limiting occurred
-            rate_limited = any(status == 429 for status in responses if status is not None)
-            
-            duration = time.time() - start_time
-            
-            if rate_limited:
-                result = TestResult("test_429_rate_limiting", "PASS", duration, 
-                                  "Rate limiting properly implemented (429 responses detected)")
-            else:
-                # Rate limiting might not be implemented, which is also okay
-                result = TestResult("test_429_rate_limiting", "PASS", duration, 
-                                  "No rate limiting detected (may not be implemented)")
-            
-        except Exception as e:
-            duration = time.time() - start_time
-            result = TestResult("test_429_rate_limiting", "ERROR", duration, str(e))
-        
-        self.suite.tests.append(result)
-        self._print_test_result(result)
+        # Fire a burst of requests all at once, past the suite-wide in-flight cap
+        url = f"{self.api_base_url}/configurations"
+        results = await asyncio.gather(*[
+            self._send_request('GET', url, {}, None, bounded=False) for _ in range(20)
+        ], return_exceptions=True)
+        responses = [r[0] for r in results if not isinstance(r, Exception)]
+        
+        # Check if any rate limiting occurred
+        rate_limited = 429 in responses
+        
+        if rate_limited:
+            return "PASS", "Rate limiting properly implemented (429 responses detected)"
+        else:
+            # Rate limiting might not be implemented, which is also okay
+            return "PASS", "No rate limiting detected (may not be implemented)"
 
+    @testcase
     async def test_error_response_structure(self):
         """Test error response structure consistency"""
-        start_time = time.time()
+        # Generate various error responses
+        error_tests = [
+            ('GET', '/nonexistent'),  # 404
+            ('POST', '/configurations'),  # 401 (no auth)
+            ('PATCH', '/configurations'),  # 405 (method not allowed)
+            ('POST', '/configurations', _JSON_HEADERS, b'{"invalid": json}'),  # 400
+        ]
         
-        try:
-            # Generate various error responses
-            error_tests = [
-                ('GET', '/nonexistent'),  # 404
-                ('POST', '/configurations'),  # 401 (no auth)
-                ('PATCH', '/configurations'),  # 405 (method not allowed)
-                ('POST', '/configurations', {'Content-Type': 'application/json'}, '{"invalid": json}'),  # 400
-            ]
-            
-            consistent_errors = 0
-            
-            for test in error_tests:
-                if len(test) == 4:
-                    method, endpoint, headers, body = test
-                    status, response, req_duration, resp_headers = await self._make_request(method, endpoint, headers, None, False, body)
-                else:
-                    method, endpoint = test
-                    status, response, req_duration, resp_headers = await self._make_request(method, endpoint)
-                
-                # Check if error response has consistent structure
-                if status >= 400 and isinstance(response, dict):
-                    # Look for common error fields
-                    has_error_field = 'error' in response or 'message' in response or 'errors' in response
-                    if has_error_field:
-                        consistent_errors += 1
-                elif status >= 400 and isinstance(response, str):
-                    # String responses are also acceptable
-                    consistent_errors += 0.5
-            
-            duration = time.time() - start_time
-            success_rate = (consistent_errors / len(error_tests)) * 100
-            
-            if success_rate >= 70:
-                result = TestResult("test_error_response_structure", "PASS", duration, 
-                                  f"Error response structure consistent: {consistent_errors}/{len(error_tests)} ({success_rate:.1f}%)")
-            else:
-                result = TestResult("test_error_response_structure", "FAIL", duration, 
-                                  f"Error response structure inconsistent: only {consistent_errors}/{len(error_tests)} ({success_rate:.1f}%)")
-            
-        except Exception as e:
-            duration = time.time() - start_time
-            result = TestResult("test_error_response_structure", "ERROR", duration, str(e))
+        consistent_errors = 0
         
-        self.suite.tests.append(result)
-        self._print_test_result(result)
+        requests = []
+        for test in error_tests:
+            if len(test) == 4:
+                method, endpoint, headers, body = test
+                requests.append(self._make_request(method, endpoint, headers, raw_body_bytes=body))
+            else:
+                method, endpoint = test
+                requests.append(self._make_request(method, endpoint))
+        
+        results = await asyncio.gather(*requests, return_exceptions=True)
+        
+        for result in results:
+            if isinstance(result, Exception):
+                continue
+            status, response, req_duration, resp_headers = result
+            
+            # Check if error response has consistent structure
+            if status >= 400 and isinstance(response, dict):
+                # Look for common error fields
+                has_error_field = not _ERR_KEYS.isdisjoint(response)
+                if has_error_field:
+                    consistent_errors += 1
+            elif status >= 400 and isinstance(response, str):
+                # String responses are also acceptable
+                consistent_errors += 0.5
+        
+        return _threshold_result(consistent_errors, len(error_tests), 70,
+                                 "Error response structure consistent", "Error response structure inconsistent")
 
+    @testcase
     async def test_error_message_consistency(self):
         """Test error message consistency and helpfulness"""
-        start_time = time.time()
+        # Test that error messages are helpful and consistent
+        status, response, req_duration, resp_headers = await self._make_request('GET', '/configurations')
         
-        try:
-            # Test that error messages are helpful and consistent
-            status, response, req_duration, resp_headers = await self._make_request('GET', '/configurations')
+        if status == 401 and isinstance(response, dict):
+            error_message = next((response[k] for k in _ERR_MESSAGE_KEYS if k in response), None) or str(response)
             
-            duration = time.time() - start_time
+            # Check if error message is helpful
+            is_helpful = _HELPFUL_RE.search(error_message) is not None
             
-            if status == 401 and isinstance(response, dict):
-                error_message = response.get('error') or response.get('message') or str(response)
-                
-                # Check if error message is helpful
-                helpful_keywords = ['unauthorized', 'authentication', 'token', 'login', 'access']
-                is_helpful = any(keyword in error_message.lower() for keyword in helpful_keywords)
-                
-                if is_helpful:
-                    result = TestResult("test_error_message_consistency", "PASS", duration, 
-                                      f"Error message helpful: {error_message[:50]}...")
-                else:
-                    result = TestResult("test_error_message_consistency", "FAIL", duration, 
-                                      f"Error message not helpful: {error_message[:50]}...")
+            if is_helpful:
+                return "PASS", f"Error message helpful: {error_message[:50]}..."
             else:
-                result = TestResult("test_error_message_consistency", "PASS", duration, 
-                                  f"Error response received (status: {status})")
-            
-        except Exception as e:
-            duration = time.time() - start_time
-            result = TestResult("test_error_message_consistency", "ERROR", duration, str(e))
-        
-        self.suite.tests.append(result)
-        self._print_test_result(result)
+                return "FAIL", f"Error message not helpful: {error_message[:50]}..."
+        else:
+            return "PASS", f"Error response received (status: {status})"
 
+    @testcase
     async def test_error_codes_mapping(self):
         """Test that error codes map to appropriate HTTP status codes"""
-        start_time = time.time()
+        # Test various scenarios and their expected status codes
+        status_tests = [
+            ('GET', '/nonexistent', [404]),  # Not found
+            ('POST', '/configurations', [401, 403]),  # Unauthorized
+            ('INVALID_METHOD', '/configurations', [405]),  # Method not allowed
+        ]
         
-        try:
-            # Test various scenarios and their expected status codes
-            status_tests = [
-                ('GET', '/nonexistent', [404]),  # Not found
-                ('POST', '/configurations', [401, 403]),  # Unauthorized
-                ('INVALID_METHOD', '/configurations', [405]),  # Method not allowed
-            ]
-            
-            correct_mappings = 0
-            
-            for method, endpoint, expected_statuses in status_tests:
-                status, response, req_duration, resp_headers = await self._make_request(method, endpoint)
-                
-                if status in expected_statuses:
-                    correct_mappings += 1
-            
-            duration = time.time() - start_time
-            success_rate = (correct_mappings / len(status_tests)) * 100
-            
-            if success_rate >= 80:
-                result = TestResult("test_error_codes_mapping", "PASS", duration, 
-                                  f"Error code mapping correct: {correct_mappings}/{len(status_tests)} ({success_rate:.1f}%)")
-            else:
-                result = TestResult("test_error_codes_mapping", "FAIL", duration, 
-                                  f"Error code mapping issues: only {correct_mappings}/{len(status_tests)} ({success_rate:.1f}%)")
-            
-        except Exception as e:
-            duration = time.time() - start_time
-            result = TestResult("test_error_codes_mapping", "ERROR", duration, str(e))
+        results = await asyncio.gather(*[
+            self._make_request(method, endpoint) for method, endpoint, expected_statuses in status_tests
+        ], return_exceptions=True)
         
-        self.suite.tests.append(result)
-        self._print_test_result(result)
+        correct_mappings = sum(
+            1 for (method, endpoint, expected_statuses), r in zip(status_tests, results)
+            if not isinstance(r, Exception) and r[0] in expected_statuses
+        )
+        
+        return _threshold_result(correct_mappings, len(status_tests), 80,
+                                 "Error code mapping correct", "Error code mapping issues")
 
+    @testcase
     async def test_malformed_json(self):
         """Test handling of malformed JSON"""
-        start_time = time.time()
         
-        try:
-            malformed_jsons = [
-                '{"incomplete": ',
-                '{"trailing": "comma",}',
-                '{unquoted: "keys"}',
-                '{"duplicate": "key", "duplicate": "value"}',
-                '{"unicode": "\uFFFF"}',
-                '{"nested": {"deep": {"very": {"extremely": {"deeply": {"nested": "value"}}}}}}' * 100,  # Very deep nesting
-            ]
-            
-            proper_rejections = 0
-            headers = {'Content-Type': 'application/json'}
-            
-            for malformed_json in malformed_jsons:
-                status, response, req_duration, resp_headers = await self._make_request('POST', '/configurations', headers, None, False, malformed_json)
-                
-                if status in [400, 401, 403]:
-                    proper_rejections += 1
-            
-            duration = time.time() - start_time
-            success_rate = (proper_rejections / len(malformed_jsons)) * 100
-            
-            if success_rate >= 80:
-                result = TestResult("test_malformed_json", "PASS", duration, 
-                                  f"Malformed JSON handling good: {proper_rejections}/{len(malformed_jsons)} ({success_rate:.1f}%)")
-            else:
-                result = TestResult("test_malformed_json", "FAIL", duration, 
-                                  f"Malformed JSON handling issues: only {proper_rejections}/{len(malformed_jsons)} ({success_rate:.1f}%)")
-            
-        except Exception as e:
-            duration = time.time() - start_time
-            result = TestResult("test_malformed_json", "ERROR", duration, str(e))
+        headers = _JSON_HEADERS
+        
+        results = await asyncio.gather(*[
+            self._make_request('POST', '/configurations', headers, raw_body_bytes=malformed_json)
+            for malformed_json in _MALFORMED_JSONS
+        ], return_exceptions=True)
+        
+        proper_rejections = sum(
+            1 for r in results
+            if not isinstance(r, Exception) and r[0] in _BAD_REQUEST_STATUSES
+        )
         
-        self.suite.tests.append(result)
-        self._print_test_result(result)
+        return _threshold_result(proper_rejections, len(_MALFORMED_JSONS), 80,
+                                 "Malformed JSON handling good", "Malformed JSON handling issues")
 
+    @testcase
     async def test_invalid_content_type(self):
         """Test handling of invalid Content-Type headers"""
-        start_time = time.time()
         
-        try:
-            invalid_content_types = [
-                '',  # Empty
-                'invalid',  # Not a valid MIME type
-                'application/',  # Incomplete
-                'text/plain; charset=invalid',  # Invalid charset
-                'application/json; boundary=something',  # Wrong parameter
-                'APPLICATION/JSON',  # Case sensitivity
-            ]
-            
-            handled_appropriately = 0
-            
-            for content_type in invalid_content_types:
-                headers = {'Content-Type': content_type}
-                status, response, req_duration, resp_headers = await self._make_request('POST', '/configurations', headers, None, False, '{}')
-                
-                # Should either reject or handle gracefully
-                if status in [400, 401, 403, 415]:
-                    handled_appropriately += 1
-            
-            duration = time.time() - start_time
-            success_rate = (handled_appropriately / len(invalid_content_types)) * 100
-            
-            if success_rate >= 70:
-                result = TestResult("test_invalid_content_type", "PASS", duration, 
-                                  f"Invalid content-type handling good: {handled_appropriately}/{len(invalid_content_types)} ({success_rate:.1f}%)")
-            else:
-                result = TestResult("test_invalid_content_type", "FAIL", duration, 
-                                  f"Invalid content-type handling issues: only {handled_appropriately}/{len(invalid_content_types)} ({success_rate:.1f}%)")
-            
-        except Exception as e:
-            duration = time.time() - start_time
-            result = TestResult("test_invalid_content_type", "ERROR", duration, str(e))
+        results = await asyncio.gather(*[
+            self._make_request('POST', '/configurations', _HEADERS_BY_CT[content_type], raw_body_bytes=_EMPTY_JSON)
+            for content_type in _INVALID_CONTENT_TYPES
+        ], return_exceptions=True)
+        
+        # Should either reject or handle gracefully
+        handled_appropriately = sum(
+            1 for r in results
+            if not isinstance(r, Exception) and r[0] in _MEDIA_TYPE_STATUSES
+        )
         
-        self.suite.tests.append(result)
-        self._print_test_result(result)
+        return _threshold_result(handled_appropriately, len(_INVALID_CONTENT_TYPES), 70,
+                                 "Invalid content-type handling good", "Invalid content-type handling issues")
 
+    @testcase
     async def test_missing_required_headers(self):
         """Test handling of missing required headers"""
-        start_time = time.time()
         
-        try:
-            # Test requests without common required headers
-            header_tests = [
-                {},  # No headers
-                {'Content-Type': 'application/json'},  # No Origin
-                {'Origin': 'http://example.com'},  # No Content-Type for POST
-                {'Accept': 'application/json'},  # Missing other headers
-            ]
-            
-            handled_gracefully = 0
-            
-            for headers in header_tests:
-                status, response, req_duration, resp_headers = await self._make_request('POST', '/configurations', headers, {'test': 'data'})
-                
-                # Should handle missing headers gracefully
-                if status in [200, 201, 400, 401, 403]:
-                    handled_gracefully += 1
-            
-            duration = time.time() - start_time
-            success_rate = (handled_gracefully / len(header_tests)) * 100
-            
-            if success_rate >= 80:
-                result = TestResult("test_missing_required_headers", "PASS", duration, 
-                                  f"Missing headers handled gracefully: {handled_gracefully}/{len(header_tests)} ({success_rate:.1f}%)")
-            else:
-                result = TestResult("test_missing_required_headers", "FAIL", duration, 
-                                  f"Missing headers handling issues: only {handled_gracefully}/{len(header_tests)} ({success_rate:.1f}%)")
-            
-        except Exception as e:
-            duration = time.time() - start_time
-            result = TestResult("test_missing_required_headers", "ERROR", duration, str(e))
+        results = await asyncio.gather(*[
+            self._make_request('POST', '/configurations', headers, raw_body_bytes=_TEST_JSON)
+            for headers in _HEADER_TESTS
+        ], return_exceptions=True)
         
-        self.suite.tests.append(result)
-        self._print_test_result(result)
+        # Should handle missing headers gracefully
+        handled_gracefully = sum(
+            1 for r in results
+            if not isinstance(r, Exception) and r[0] in _MISSING_HEADER_STATUSES
+        )
+        
+        return _threshold_result(handled_gracefully, len(_HEADER_TESTS), 80,
+                                 "Missing headers handled gracefully", "Missing headers handling issues")
 
+    @testcase
     async def test_extremely_long_urls(self):
         """Test handling of extremely long URLs"""
-        start_time = time.time()
         
-        try:
-            # Test various long URL scenarios
-            long_urls = [
-                '/configurations/' + 'x' * 1000,  # Very long ID
-                '/rounds/' + 'a' * 2000,  # Even longer ID
-                '/scores/' + '?' + '&'.join([f'param{i}=value{i}' for i in range(100)]),  # Many query params
-                '/user/profile' + '?' + 'x' * 5000,  # Very long query string
-            ]
-            
-            handled_appropriately = 0
-            
-            for url in long_urls:
-                status, response, req_duration, resp_headers = await self._make_request('GET', url)
-                
-                # Should either reject or handle gracefully (not crash)
-                if status in [400, 401, 403, 404, 414]:  # 414 = URI Too Long
-                    handled_appropriately += 1
-                elif status is None:  # Network level rejection is also acceptable
-                    handled_appropriately += 0.5
-            
-            duration = time.time() - start_time
-            success_rate = (handled_appropriately / len(long_urls)) * 100
-            
-            if success_rate >= 70:
-                result = TestResult("test_extremely_long_urls", "PASS", duration, 
-                                  f"Long URL handling good: {handled_appropriately}/{len(long_urls)} ({success_rate:.1f}%)")
-            else:
-                result = TestResult("test_extremely_long_urls", "FAIL", duration, 
-                                  f"Long URL handling issues: only {handled_appropriately}/{len(long_urls)} ({success_rate:.1f}%)")
-            
-        except Exception as e:
-            duration = time.time() - start_time
-            result = TestResult("test_extremely_long_urls", "ERROR", duration, str(e))
+        results = await asyncio.gather(*[self._make_request('GET', url) for url in _LONG_URLS], return_exceptions=True)
+        statuses = [r[0] for r in results if not isinstance(r, Exception)]
+        
+        # Should either reject or handle gracefully (not crash); a network
+        # level rejection (no status) is also acceptable for partial credit
+        handled_appropriately = sum(
+            1 if status in _LONG_URL_STATUSES else 0.5 if status is None else 0
+            for status in statuses
+        )
         
-        self.suite.tests.append(result)
-        self._print_test_result(result)
+        return _threshold_result(handled_appropriately, len(_LONG_URLS), 70,
+                                 "Long URL handling good", "Long URL handling issues")
 
+    @testcase
     async def test_invalid_http_methods(self):
         """Test handling of invalid HTTP methods"""
-        start_time = time.time()
         
-        try:
-            # Test completely invalid HTTP methods
-            invalid_methods = [
-                'INVALID',
-                'HACK',
-                'EXPLOIT',
-                'TEST',
-                '',  # Empty method
-                'get',  # Lowercase (should be uppercase)
-                'G E T',  # Spaces
-                'GET/POST',  # Multiple methods
-            ]
-            
-            handled_appropriately = 0
-            
-            for method in invalid_methods:
-                try:
-                    status, response, req_duration, resp_headers = await self._make_request(method, '/configurations')
-                    
-                    # Should reject invalid methods
-                    if status in [400, 405, 501]:  # 501 = Not Implemented
-                        handled_appropriately += 1
-                except Exception:
-                    # Exception at client level is also acceptable for invalid methods
-                    handled_appropriately += 1
-            
-            duration = time.time() - start_time
-            success_rate = (handled_appropriately / len(invalid_methods)) * 100
-            
-            if success_rate >= 70:
-                result = TestResult("test_invalid_http_methods", "PASS", duration, 
-                                  f"Invalid method handling good: {handled_appropriately}/{len(invalid_methods)} ({success_rate:.1f}%)")
-            else:
-                result = TestResult("test_invalid_http_methods", "FAIL", duration, 
-                                  f"Invalid method handling issues: only {handled_appropriately}/{len(invalid_methods)} ({success_rate:.1f}%)")
-            
-        except Exception as e:
-            duration = time.time() - start_time
-            result = TestResult("test_invalid_http_methods", "ERROR", duration, str(e))
+        # Methods the client rejects before sending count as handled without a round trip
+        results = await asyncio.gather(*[
+            self._make_request(method, '/configurations') for method in _SERVER_INVALID_METHODS
+        ], return_exceptions=True)
+        
+        # Should reject invalid methods (501 = Not Implemented)
+        handled_appropriately = len(_CLIENT_INVALID_METHODS) + sum(
+            1 for r in results
+            if isinstance(r, Exception) or r[0] in _INVALID_METHOD_STATUSES
+        )
         
-        self.suite.tests.append(result)
-        self._print_test_result(result)
\ No newline at end of file
+        return _threshold_result(handled_appropriately, len(_INVALID_METHODS), 70,
+                                 "Invalid method handling good", "Invalid method handling issues")